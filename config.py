@@ -3,7 +3,13 @@
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
+# Load .env only once, even if this module is reloaded
+if not globals().get("_DOTENV_LOADED"):
+    load_dotenv()
+    _DOTENV_LOADED = True
+
+# Single snapshot of the environment used to build Config
+_ENV = dict(os.environ)
 
 
 class Config:
@@ -14,27 +20,29 @@ class Config:
     SILVER_API_URL = "https://auragold.netlify.app/api/prices?metal=silver"
     
     # Email Configuration (Resend - Free tier: 100 emails/day)
-    RESEND_API_KEY = os.getenv("RESEND_API_KEY", "")
-    EMAIL_TO = os.getenv("EMAIL_TO", "")
-    EMAIL_FROM = os.getenv("EMAIL_FROM", "Metal Price Tracker <onboarding@resend.dev>")
+    RESEND_API_KEY = _ENV.get("RESEND_API_KEY", "")
+    EMAIL_TO = _ENV.get("EMAIL_TO", "")
+    EMAIL_FROM = _ENV.get("EMAIL_FROM", "Metal Price Tracker <onboarding@resend.dev>")
     
     # SMS Configuration
     # Textbelt - International (limited free tier)
-    TEXTBELT_KEY = os.getenv("TEXTBELT_KEY", "textbelt")
+    TEXTBELT_KEY = _ENV.get("TEXTBELT_KEY", "textbelt")
     # Fast2SMS - India (free tier available)
-    FAST2SMS_API_KEY = os.getenv("FAST2SMS_API_KEY", "")
-    PHONE_NUMBER = os.getenv("PHONE_NUMBER", "")
+    FAST2SMS_API_KEY = _ENV.get("FAST2SMS_API_KEY", "")
+    PHONE_NUMBER = _ENV.get("PHONE_NUMBER", "")
     
     # Alert Thresholds
-    ALERT_10_PERCENT = os.getenv("ALERT_10_PERCENT", "true").lower() == "true"
-    ALERT_20_PERCENT = os.getenv("ALERT_20_PERCENT", "true").lower() == "true"
+    ALERT_10_PERCENT = _ENV.get("ALERT_10_PERCENT", "true").lower() == "true"
+    ALERT_20_PERCENT = _ENV.get("ALERT_20_PERCENT", "true").lower() == "true"
     
     # Baseline Prices (for tracking price drops)
-    GOLD_BASELINE_PRICE = float(os.getenv("GOLD_BASELINE_PRICE") or 0)
-    SILVER_BASELINE_PRICE = float(os.getenv("SILVER_BASELINE_PRICE") or 0)
+    GOLD_BASELINE_PRICE = float(_ENV.get("GOLD_BASELINE_PRICE") or 0)
+    SILVER_BASELINE_PRICE = float(_ENV.get("SILVER_BASELINE_PRICE") or 0)
+    GOLD_BASELINE_SET = GOLD_BASELINE_PRICE > 0
+    SILVER_BASELINE_SET = SILVER_BASELINE_PRICE > 0
     
     # Check Interval
-    CHECK_INTERVAL_MINUTES = int(os.getenv("CHECK_INTERVAL_MINUTES", "30"))
+    CHECK_INTERVAL_MINUTES = int(_ENV.get("CHECK_INTERVAL_MINUTES", "30"))
     
     # State file for tracking alerts sent
     STATE_FILE = os.path.join(os.path.dirname(__file__), "alert_state.json")
@@ -0,0 +1,21 @@
+"""Shared HTTP helpers for the price API and SMS backends."""
+
+_requests = None
+
+
+def get_requests():
+    """Import requests on first use to keep CLI startup fast."""
+    global _requests
+    if _requests is None:
+        import requests
+        _requests = requests
+    return _requests
+
+
+def new_session():
+    """Create a keep-alive HTTP session with a small connection pool."""
+    requests = get_requests()
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    session.mount("https://", adapter)
+    return session
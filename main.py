@@ -20,7 +20,7 @@ Usage:
 import argparse
 import sys
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from config import Config
 from price_tracker import PriceTracker
@@ -35,81 +35,96 @@ def print_header():
     print("=" * 50 + "\n")
 
 
+def fetch_prices(tracker: PriceTracker) -> list:
+    """Fetch gold and silver prices concurrently.
+    
+    Returns list of (metal, price_data) pairs in a fixed order.
+    """
+    metals = ["gold", "silver"]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        return list(zip(metals, executor.map(tracker.fetch_current_price, metals)))
+
+
 def check_prices_and_notify(tracker: PriceTracker, notifier: Notifier):
     """Check prices and send notifications if thresholds are met."""
-    print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Checking prices...")
+    print(f"\n[{time.strftime('%Y-%m-%d %H:%M:%S')}] Checking prices...")
     
-    for metal in ["gold", "silver"]:
-        price_data = tracker.fetch_current_price(metal)
-        
-        if not price_data:
-            print(f"  ⚠️  Could not fetch {metal} price")
-            continue
-        
-        summary = tracker.get_price_summary(price_data)
-        
-        # Display current status
-        print(f"\n  📊 {summary['metal']}:")
-        print(f"     Current Price: ₹{summary['current_price_with_gst']:.2f} (with 3% GST)")
-        
-        if summary['baseline_price']:
-            print(f"     Baseline: ₹{summary['baseline_price']:.2f}")
-            if summary['drop_percentage'] is not None:
-                direction = "📉" if summary['drop_percentage'] > 0 else "📈"
-                color_word = "down" if summary['drop_percentage'] > 0 else "up"
-                print(f"     Change: {direction} {abs(summary['drop_percentage']):.2f}% {color_word}")
-        else:
-            print(f"     ⚠️  Baseline not set. Run with --set-baseline to set it.")
-            continue
-        
-        # Check if price went UP - update baseline to track from new high
-        if summary['drop_percentage'] is not None and summary['drop_percentage'] < -5:
-            # Price is MORE than 5% ABOVE baseline (negative drop = price increase)
-            old_baseline = summary['baseline_price']
-            new_baseline = price_data.display_price
-            tracker.set_baseline(metal, new_baseline)
-            print(f"     📈 Price went UP! Baseline updated: ₹{old_baseline:.2f} → ₹{new_baseline:.2f}")
-            print(f"     🎯 Now tracking drops from new high price")
-            # Update summary with new baseline for any alerts
-            summary['baseline_price'] = new_baseline
-            summary['drop_percentage'] = 0
-        
-        # Check for alerts (price drops)
-        alerts = tracker.check_alerts(metal, price_data.display_price)
-        
-        for threshold in alerts:
-            print(f"\n  🚨 ALERT: {metal.upper()} has dropped {threshold}% from baseline!")
+    # Save alert state once for the whole run
+    with notifier.alert_state:
+        for metal, price_data in fetch_prices(tracker):
+            if not price_data:
+                print(f"  ⚠️  Could not fetch {metal} price")
+                continue
+            
+            baseline = tracker.get_baseline(metal)
+            drop_percentage = tracker.drop_from(baseline, price_data.display_price)
             
-            results = notifier.send_price_alert(metal, threshold, summary)
+            # Display current status
+            print(f"\n  📊 {metal.upper()}:")
+            print(f"     Current Price: ₹{price_data.price_with_gst:.2f} (with 3% GST)")
             
-            if results["skipped"]:
-                print(f"     (Alert was already sent previously)")
+            if baseline:
+                print(f"     Baseline: ₹{baseline:.2f}")
+                if drop_percentage is not None:
+                    direction = "📉" if drop_percentage > 0 else "📈"
+                    color_word = "down" if drop_percentage > 0 else "up"
+                    print(f"     Change: {direction} {abs(drop_percentage):.2f}% {color_word}")
             else:
-                if results["email"]:
-                    print(f"     ✅ Email notification sent")
-                if results["sms"]:
-                    print(f"     ✅ SMS notification sent")
-                if not results["email"] and not results["sms"]:
-                    print(f"     ⚠️  No notifications sent (check configuration)")
+                print(f"     ⚠️  Baseline not set. Run with --set-baseline to set it.")
+                continue
+            
+            # Check if price went UP - update baseline to track from new high
+            if drop_percentage is not None and drop_percentage < -5:
+                # Price is MORE than 5% ABOVE baseline (negative drop = price increase)
+                old_baseline = baseline
+                new_baseline = price_data.display_price
+                tracker.set_baseline(metal, new_baseline)
+                print(f"     📈 Price went UP! Baseline updated: ₹{old_baseline:.2f} → ₹{new_baseline:.2f}")
+                print(f"     🎯 Now tracking drops from new high price")
+                # Use the new baseline for any alerts
+                baseline = new_baseline
+                drop_percentage = 0
+            
+            # Check for alerts (price drops)
+            alerts = tracker.check_alerts(metal, price_data.display_price)
+            
+            if not alerts:
+                continue
+            
+            # The full summary is only needed to build notifications
+            summary = tracker.build_price_summary(price_data, baseline, drop_percentage)
+            
+            for threshold in alerts:
+                print(f"\n  🚨 ALERT: {metal.upper()} has dropped {threshold}% from baseline!")
                 
-                # SIP-style: Auto-update baseline after alert is sent
-                # This allows receiving alerts for the next 10%/20% drop
-                if results["email"] or results["sms"]:
-                    old_baseline = summary['baseline_price']
-                    new_baseline = price_data.display_price
-                    tracker.set_baseline(metal, new_baseline)
-                    notifier.reset_alerts(metal)
-                    print(f"     📊 Baseline updated: ₹{old_baseline:.2f} → ₹{new_baseline:.2f}")
-                    print(f"     🔄 Ready for next {threshold}% drop alert")
+                results = notifier.send_price_alert(metal, threshold, summary)
+                
+                if results["skipped"]:
+                    print(f"     (Alert was already sent previously)")
+                else:
+                    if results["email"]:
+                        print(f"     ✅ Email notification sent")
+                    if results["sms"]:
+                        print(f"     ✅ SMS notification sent")
+                    if not results["email"] and not results["sms"]:
+                        print(f"     ⚠️  No notifications sent (check configuration)")
+                    
+                    # SIP-style: Auto-update baseline after alert is sent
+                    # This allows receiving alerts for the next 10%/20% drop
+                    if results["email"] or results["sms"]:
+                        old_baseline = summary['baseline_price']
+                        new_baseline = price_data.display_price
+                        tracker.set_baseline(metal, new_baseline)
+                        notifier.reset_alerts(metal)
+                        print(f"     📊 Baseline updated: ₹{old_baseline:.2f} → ₹{new_baseline:.2f}")
+                        print(f"     🔄 Ready for next {threshold}% drop alert")
 
 
 def set_baseline(tracker: PriceTracker, notifier: Notifier):
     """Set current prices as baseline."""
     print("\nSetting current prices as baseline...")
     
-    for metal in ["gold", "silver"]:
-        price_data = tracker.fetch_current_price(metal)
-        
+    for metal, price_data in fetch_prices(tracker):
         if price_data:
             tracker.set_baseline(metal, price_data.display_price)
             print(f"  ✅ {metal.upper()}: ₹{price_data.display_price:.2f}")
@@ -139,8 +154,7 @@ def show_status(tracker: PriceTracker):
             print(f"  {metal.upper()}: Not set")
     
     print("\n💰 Current Prices:")
-    for metal in ["gold", "silver"]:
-        price_data = tracker.fetch_current_price(metal)
+    for metal, price_data in fetch_prices(tracker):
         if price_data:
             summary = tracker.get_price_summary(price_data)
             print(f"\n  {summary['metal']}:")
@@ -154,24 +168,26 @@ def show_status(tracker: PriceTracker):
 
 def run_daemon(tracker: PriceTracker, notifier: Notifier):
     """Run continuously with scheduled checks."""
-    import schedule
+    minutes = Config.CHECK_INTERVAL_MINUTES
+    if minutes < 1:
+        print(f"⚠️  CHECK_INTERVAL_MINUTES={minutes} is too low, using 1 minute")
+        minutes = 1
+    interval = minutes * 60
     
     print(f"\n🔄 Starting daemon mode...")
-    print(f"   Checking every {Config.CHECK_INTERVAL_MINUTES} minutes")
+    print(f"   Checking every {minutes} minutes")
     print(f"   Press Ctrl+C to stop\n")
     
-    # Run immediately on start
-    check_prices_and_notify(tracker, notifier)
-    
-    # Schedule periodic checks
-    schedule.every(Config.CHECK_INTERVAL_MINUTES).minutes.do(
-        check_prices_and_notify, tracker, notifier
-    )
-    
     try:
+        next_run = time.monotonic()
         while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute if scheduled task is due
+            check_prices_and_notify(tracker, notifier)
+            
+            # Sleep until the next absolute check time so runs don't drift;
+            # if a check overran its slot, start the next one now instead of
+            # running the missed ones back to back
+            next_run = max(next_run + interval, time.monotonic())
+            time.sleep(max(0, next_run - time.monotonic()))
     except KeyboardInterrupt:
         print("\n\n👋 Daemon stopped.")
 
@@ -1,65 +1,173 @@
 """Notification module for Email and SMS alerts."""
 
 import json
-import requests
 from datetime import datetime
 from typing import Optional
 
 from config import Config
+from http_client import new_session
+from storage import load_json, save_json
+
+
+_now = datetime.now
+
+
+# Price alert email body, filled in with str.format_map per alert
+_EMAIL_TEMPLATE = """
+<html>
+<body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
+    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; color: white; text-align: center;">
+        <h1 style="margin: 0;">🪙 Metal Price Alert</h1>
+    </div>
+    
+    <div style="padding: 20px; background: #f8f9fa; border-radius: 10px; margin-top: 20px;">
+        <h2 style="color: #e74c3c; margin-top: 0;">
+            ⚠️ {metal_upper} has dropped {threshold}% from baseline!
+        </h2>
+        
+        <table style="width: 100%; border-collapse: collapse;">
+            <tr>
+                <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Product</strong></td>
+                <td style="padding: 10px; border-bottom: 1px solid #ddd;">{product_name}</td>
+            </tr>
+            <tr>
+                <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Current Price (with 3% GST)</strong></td>
+                <td style="padding: 10px; border-bottom: 1px solid #ddd; color: #e74c3c; font-weight: bold;">
+                    ₹{current_price_with_gst:.2f}
+                </td>
+            </tr>
+            <tr>
+                <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Current Price (without GST)</strong></td>
+                <td style="padding: 10px; border-bottom: 1px solid #ddd;">₹{current_price_without_gst:.2f}</td>
+            </tr>
+            <tr>
+                <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Baseline Price</strong></td>
+                <td style="padding: 10px; border-bottom: 1px solid #ddd;">₹{baseline_price:.2f}</td>
+            </tr>
+            <tr>
+                <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Drop</strong></td>
+                <td style="padding: 10px; border-bottom: 1px solid #ddd; color: #e74c3c;">
+                    {drop_percentage:.2f}%
+                </td>
+            </tr>
+            <tr>
+                <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Buy Price</strong></td>
+                <td style="padding: 10px; border-bottom: 1px solid #ddd;">₹{buy_price:.2f}</td>
+            </tr>
+            <tr>
+                <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Sell Price</strong></td>
+                <td style="padding: 10px; border-bottom: 1px solid #ddd;">₹{sell_price:.2f}</td>
+            </tr>
+            <tr>
+                <td style="padding: 10px;"><strong>Last Updated</strong></td>
+                <td style="padding: 10px;">{updated_at}</td>
+            </tr>
+        </table>
+    </div>
+    
+    <div style="padding: 20px; text-align: center; color: #666; font-size: 12px;">
+        <p>This is an automated alert from Metal Price Tracker</p>
+        <p>Data source: <a href="https://auragold.netlify.app">Aura Gold</a></p>
+    </div>
+</body>
+</html>
+"""
+
+
+# Price alert SMS text, filled in with str.format per alert
+_SMS_TEMPLATE = (
+    "🚨 {metal_upper} PRICE ALERT!\n"
+    "Price dropped {threshold}%!\n"
+    "Current: ₹{current:.2f}\n"
+    "Baseline: ₹{baseline:.2f}\n"
+    "Drop: {drop:.2f}%"
+)
+
+
+# Threshold (percent) -> slot in each metal's sent-timestamp list
+_IDX = {10: 0, 20: 1}
 
 
 class AlertState:
     """Manages alert state to prevent duplicate notifications."""
     
     def __init__(self):
-        self.state = self._load_state()
+        # metal -> [sent_at for 10%, sent_at for 20%]
+        self._sent = self._load_state()
+        self._dirty = False
+        self._batch_depth = 0
+    
+    def __enter__(self):
+        """Defer state writes until the outermost block exits."""
+        self._batch_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
+        return False
     
     def _load_state(self) -> dict:
         """Load alert state from file."""
+        sent = {"gold": [None, None], "silver": [None, None]}
         try:
-            with open(Config.STATE_FILE, 'r') as f:
-                return json.load(f)
+            state = load_json(Config.STATE_FILE)
         except (FileNotFoundError, json.JSONDecodeError):
-            return {
-                "gold": {"10": None, "20": None},
-                "silver": {"10": None, "20": None}
-            }
+            return sent
+        
+        for metal, thresholds in state.items():
+            sent[metal] = [thresholds.get("10"), thresholds.get("20")]
+        return sent
     
     def _save_state(self):
         """Save alert state to file."""
-        with open(Config.STATE_FILE, 'w') as f:
-            json.dump(self.state, f, indent=2)
+        state = {
+            metal: {"10": slots[0], "20": slots[1]}
+            for metal, slots in self._sent.items()
+        }
+        save_json(Config.STATE_FILE, state)
+        self._dirty = False
+    
+    def flush(self):
+        """Save alert state only if it changed since the last save."""
+        if self._dirty:
+            self._save_state()
+    
+    def _changed(self):
+        """Record a state change, saving now unless inside a batch."""
+        self._dirty = True
+        if not self._batch_depth:
+            self._save_state()
     
     def was_alert_sent(self, metal: str, threshold: int) -> bool:
         """Check if an alert was already sent for this threshold."""
-        if metal not in self.state:
-            self.state[metal] = {"10": None, "20": None}
-        
-        return self.state[metal].get(str(threshold)) is not None
+        slots = self._sent.get(metal)
+        return slots is not None and slots[_IDX[threshold]] is not None
     
     def mark_alert_sent(self, metal: str, threshold: int):
         """Mark that an alert was sent."""
-        if metal not in self.state:
-            self.state[metal] = {"10": None, "20": None}
-        
-        self.state[metal][str(threshold)] = datetime.now().isoformat()
-        self._save_state()
+        slots = self._sent.setdefault(metal, [None, None])
+        slots[_IDX[threshold]] = _now().isoformat()
+        self._changed()
     
     def reset_alerts(self, metal: Optional[str] = None):
         """Reset alert state (when price recovers or baseline changes)."""
-        if metal:
-            self.state[metal] = {"10": None, "20": None}
-        else:
-            self.state = {
-                "gold": {"10": None, "20": None},
-                "silver": {"10": None, "20": None}
-            }
-        self._save_state()
+        metals = [metal] if metal else list(self._sent)
+        for name in metals:
+            # Skip the write when nothing was set
+            if self._sent.get(name) != [None, None]:
+                self._sent[name] = [None, None]
+                self._dirty = True
+        if not self._batch_depth:
+            self.flush()
 
 
 class EmailNotifier:
     """Send email notifications using Resend (free tier: 100 emails/day)."""
     
+    _resend = None
+    
     def __init__(self):
         self.api_key = Config.RESEND_API_KEY
         self.from_email = Config.EMAIL_FROM
@@ -72,7 +180,10 @@ class EmailNotifier:
             return False
         
         try:
-            import resend
+            if EmailNotifier._resend is None:
+                import resend
+                EmailNotifier._resend = resend
+            resend = EmailNotifier._resend
             resend.api_key = self.api_key
             
             response = resend.Emails.send({
@@ -91,67 +202,14 @@ class EmailNotifier:
     
     def send_price_alert(self, metal: str, threshold: int, summary: dict) -> bool:
         """Send a price drop alert email."""
-        subject = f"🚨 {metal.upper()} Price Alert: {threshold}% Drop!"
+        if not Config.is_email_configured():
+            print("Email not configured. Skipping email notification.")
+            return False
         
-        html_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; color: white; text-align: center;">
-                <h1 style="margin: 0;">🪙 Metal Price Alert</h1>
-            </div>
-            
-            <div style="padding: 20px; background: #f8f9fa; border-radius: 10px; margin-top: 20px;">
-                <h2 style="color: #e74c3c; margin-top: 0;">
-                    ⚠️ {metal.upper()} has dropped {threshold}% from baseline!
-                </h2>
-                
-                <table style="width: 100%; border-collapse: collapse;">
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Product</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{summary['product_name']}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Current Price (with 3% GST)</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd; color: #e74c3c; font-weight: bold;">
-                            ₹{summary['current_price_with_gst']:.2f}
-                        </td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Current Price (without GST)</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">₹{summary['current_price_without_gst']:.2f}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Baseline Price</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">₹{summary['baseline_price']:.2f}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Drop</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd; color: #e74c3c;">
-                            {summary['drop_percentage']:.2f}%
-                        </td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Buy Price</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">₹{summary['buy_price']:.2f}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Sell Price</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">₹{summary['sell_price']:.2f}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px;"><strong>Last Updated</strong></td>
-                        <td style="padding: 10px;">{summary['updated_at']}</td>
-                    </tr>
-                </table>
-            </div>
-            
-            <div style="padding: 20px; text-align: center; color: #666; font-size: 12px;">
-                <p>This is an automated alert from Metal Price Tracker</p>
-                <p>Data source: <a href="https://auragold.netlify.app">Aura Gold</a></p>
-            </div>
-        </body>
-        </html>
-        """
+        subject = f"🚨 {metal.upper()} Price Alert: {threshold}% Drop!"
+        html_body = _EMAIL_TEMPLATE.format_map(
+            summary | {"metal_upper": metal.upper(), "threshold": threshold}
+        )
         
         return self.send(subject, html_body)
 
@@ -163,6 +221,22 @@ class SMSNotifier:
         self.textbelt_key = Config.TEXTBELT_KEY
         self.fast2sms_key = getattr(Config, 'FAST2SMS_API_KEY', '')
         self.phone_number = Config.PHONE_NUMBER
+        self._session = None
+        
+        # Pick the SMS backend once based on the configured number
+        is_indian = self.phone_number.startswith(("+91", "91"))
+        if is_indian and self.fast2sms_key:
+            self._route = self._send_fast2sms
+        elif is_indian:
+            self._route = self._send_textbelt_indian
+        else:
+            self._route = self._send_textbelt
+    
+    def _get_session(self):
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None:
+            self._session = new_session()
+        return self._session
     
     def send(self, message: str) -> bool:
         """Send an SMS notification."""
@@ -170,18 +244,14 @@ class SMSNotifier:
             print("SMS not configured. Skipping SMS notification.")
             return False
         
-        # Check if it's an Indian number
-        is_indian = self.phone_number.startswith("+91") or self.phone_number.startswith("91")
-        
-        if is_indian and self.fast2sms_key:
-            return self._send_fast2sms(message)
-        elif is_indian:
-            # Try Fast2SMS first, then fallback info
-            print("Indian number detected. Fast2SMS recommended for India.")
-            print("Get free API key at: https://www.fast2sms.com/")
-            return self._send_textbelt(message)  # Will likely fail but try anyway
-        else:
-            return self._send_textbelt(message)
+        return self._route(message)
+    
+    def _send_textbelt_indian(self, message: str) -> bool:
+        """Send to an Indian number via Textbelt when no Fast2SMS key is set."""
+        # Try Fast2SMS first, then fallback info
+        print("Indian number detected. Fast2SMS recommended for India.")
+        print("Get free API key at: https://www.fast2sms.com/")
+        return self._send_textbelt(message)  # Will likely fail but try anyway
     
     def _send_fast2sms(self, message: str) -> bool:
         """Send SMS via Fast2SMS (works for India, free tier available)."""
@@ -193,7 +263,7 @@ class SMSNotifier:
             elif phone.startswith("91"):
                 phone = phone[2:]
             
-            response = requests.post(
+            response = self._get_session().post(
                 "https://www.fast2sms.com/dev/bulkV2",
                 headers={
                     "authorization": self.fast2sms_key,
@@ -225,7 +295,7 @@ class SMSNotifier:
     def _send_textbelt(self, message: str) -> bool:
         """Send SMS via Textbelt (international, but limited free tier)."""
         try:
-            response = requests.post(
+            response = self._get_session().post(
                 "https://textbelt.com/text",
                 data={
                     "phone": self.phone_number,
@@ -256,12 +326,12 @@ class SMSNotifier:
     
     def send_price_alert(self, metal: str, threshold: int, summary: dict) -> bool:
         """Send a price drop alert SMS."""
-        message = (
-            f"🚨 {metal.upper()} PRICE ALERT!\n"
-            f"Price dropped {threshold}%!\n"
-            f"Current: ₹{summary['current_price_with_gst']:.2f}\n"
-            f"Baseline: ₹{summary['baseline_price']:.2f}\n"
-            f"Drop: {summary['drop_percentage']:.2f}%"
+        message = _SMS_TEMPLATE.format(
+            metal_upper=metal.upper(),
+            threshold=threshold,
+            current=summary['current_price_with_gst'],
+            baseline=summary['baseline_price'],
+            drop=summary['drop_percentage']
         )
         
         return self.send(message)
@@ -1,12 +1,18 @@
 """Price tracking module for Gold and Silver."""
 
 import json
-import requests
+import threading
 from datetime import datetime
 from typing import Optional
 from dataclasses import dataclass
 
 from config import Config
+from http_client import get_requests, new_session
+from storage import load_json, save_json
+
+
+# Shared result for check_alerts when no threshold is met
+_EMPTY = ()
 
 
 @dataclass
@@ -30,44 +36,84 @@ class PriceTracker:
     """Tracks metal prices from Aura Gold API."""
     
     def __init__(self):
-        self.baseline_prices = self._load_baseline_prices()
+        # Snapshot config values used on every price check
+        self._alert10 = Config.ALERT_10_PERCENT
+        self._alert20 = Config.ALERT_20_PERCENT
+        self._gold_base = Config.GOLD_BASELINE_PRICE
+        self._silver_base = Config.SILVER_BASELINE_PRICE
+        self._gold_base_set = Config.GOLD_BASELINE_SET
+        self._silver_base_set = Config.SILVER_BASELINE_SET
+        # Saved baselines; 0.0 means "not set"
+        self._baseline_gold = 0.0
+        self._baseline_silver = 0.0
+        self._baseline_set_at = None
+        self._load_baseline_prices()
+        self._session = None
+        self._session_lock = threading.Lock()
+    
+    def _get_session(self):
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None:
+            # Prices may be fetched from several threads at once
+            with self._session_lock:
+                if self._session is None:
+                    self._session = new_session()
+        return self._session
     
-    def _load_baseline_prices(self) -> dict:
+    def _load_baseline_prices(self):
         """Load baseline prices from file."""
         try:
-            with open(Config.BASELINE_FILE, 'r') as f:
-                return json.load(f)
+            data = load_json(Config.BASELINE_FILE)
         except (FileNotFoundError, json.JSONDecodeError):
-            return {"gold": None, "silver": None, "set_at": None}
+            return
+        
+        self._baseline_gold = float(data.get("gold") or 0)
+        self._baseline_silver = float(data.get("silver") or 0)
+        self._baseline_set_at = data.get("set_at")
     
     def _save_baseline_prices(self):
         """Save baseline prices to file."""
-        with open(Config.BASELINE_FILE, 'w') as f:
-            json.dump(self.baseline_prices, f, indent=2)
+        save_json(Config.BASELINE_FILE, {
+            "gold": self._baseline_gold or None,
+            "silver": self._baseline_silver or None,
+            "set_at": self._baseline_set_at
+        })
     
     def set_baseline(self, metal: str, price: float):
         """Set baseline price for a metal."""
-        self.baseline_prices[metal] = price
-        self.baseline_prices["set_at"] = datetime.now().isoformat()
+        if metal == "gold":
+            self._baseline_gold = float(price)
+        elif metal == "silver":
+            self._baseline_silver = float(price)
+        self._baseline_set_at = datetime.now().isoformat()
         self._save_baseline_prices()
         print(f"Baseline set for {metal}: ₹{price:.2f}")
     
     def get_baseline(self, metal: str) -> Optional[float]:
         """Get baseline price for a metal."""
-        # Check environment variable first
-        if metal == "gold" and Config.GOLD_BASELINE_PRICE > 0:
-            return Config.GOLD_BASELINE_PRICE
-        if metal == "silver" and Config.SILVER_BASELINE_PRICE > 0:
-            return Config.SILVER_BASELINE_PRICE
-        
-        return self.baseline_prices.get(metal)
+        # Environment variable takes precedence over the saved baseline
+        if metal == "gold":
+            if self._gold_base_set:
+                return self._gold_base
+            if self._baseline_gold > 0:
+                return self._baseline_gold
+            return None
+        if metal == "silver":
+            if self._silver_base_set:
+                return self._silver_base
+            if self._baseline_silver > 0:
+                return self._baseline_silver
+            return None
+        return None
     
     def fetch_current_price(self, metal: str) -> Optional[PriceData]:
         """Fetch current price for gold or silver."""
         url = Config.GOLD_API_URL if metal == "gold" else Config.SILVER_API_URL
         
+        requests = get_requests()
+        
         try:
-            response = requests.get(url, timeout=30)
+            response = self._get_session().get(url, timeout=30)
             response.raise_for_status()
             data = response.json()
             
@@ -97,38 +143,49 @@ class PriceTracker:
     
     def calculate_drop_percentage(self, metal: str, current_price: float) -> Optional[float]:
         """Calculate percentage drop from baseline."""
-        baseline = self.get_baseline(metal)
+        return self.drop_from(self.get_baseline(metal), current_price)
+    
+    @staticmethod
+    def drop_from(baseline: Optional[float], current_price: float) -> Optional[float]:
+        """Calculate percentage drop of current_price from a given baseline."""
         if baseline is None or baseline <= 0:
             return None
         
         drop = ((baseline - current_price) / baseline) * 100
         return drop
     
-    def check_alerts(self, metal: str, current_price: float) -> list:
+    def check_alerts(self, metal: str, current_price: float) -> tuple:
         """Check if any alert thresholds are met.
         
-        Returns list of triggered alert levels (e.g., [10, 20])
+        Returns a tuple of triggered alert levels (e.g., (10, 20)).
         """
         drop_percentage = self.calculate_drop_percentage(metal, current_price)
         
-        if drop_percentage is None:
-            return []
+        # Common case: nothing to alert on, avoid building a list
+        if drop_percentage is None or drop_percentage < 10:
+            return _EMPTY
         
         alerts = []
         
-        if Config.ALERT_10_PERCENT and drop_percentage >= 10:
+        if self._alert10:
             alerts.append(10)
         
-        if Config.ALERT_20_PERCENT and drop_percentage >= 20:
+        if self._alert20 and drop_percentage >= 20:
             alerts.append(20)
         
-        return alerts
+        return tuple(alerts)
     
     def get_price_summary(self, price_data: PriceData) -> dict:
         """Get a summary of price with baseline comparison."""
         baseline = self.get_baseline(price_data.metal)
-        drop_percentage = self.calculate_drop_percentage(price_data.metal, price_data.display_price)
+        drop_percentage = self.drop_from(baseline, price_data.display_price)
         
+        return self.build_price_summary(price_data, baseline, drop_percentage)
+    
+    @staticmethod
+    def build_price_summary(price_data: PriceData, baseline: Optional[float],
+                            drop_percentage: Optional[float]) -> dict:
+        """Build a price summary from an already known baseline and drop."""
         return {
             "metal": price_data.metal.upper(),
             "product_name": price_data.product_name,
@@ -0,0 +1,37 @@
+"""JSON file persistence for alert state and baseline prices.
+
+Uses orjson (listed in requirements.txt) and falls back to the standard
+library if it is not installed.
+"""
+
+import os
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(data) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+
+def load_json(path: str) -> dict:
+    """Read and parse a JSON file.
+    
+    Raises FileNotFoundError or json.JSONDecodeError like json.load.
+    """
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def save_json(path: str, data: dict):
+    """Write data to path atomically via a temp file and rename."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_dumps(data))
+    os.replace(tmp_path, path)